@@ -15,8 +15,6 @@
 
 """Extracts distribution of inflections from morphological analyses."""
 
-import collections
-import itertools
 from typing import Generator
 
 from turkish_morphology import analysis_pb2
@@ -35,18 +33,22 @@ def main(unused_argv):
   sentence = "Ayşe eve geldiğinde Ali gitmişti"
   tokens = sentence.split()
 
-  analyses = itertools.chain.from_iterable(_analyze(t) for t in tokens)
-  igs = itertools.chain.from_iterable(a.ig for a in analyses)
-  inflections = itertools.chain.from_iterable(ig.inflection for ig in igs)
-  features = list((i.feature.category, i.feature.value) for i in inflections)
+  counts = {}
 
-  total_count = len(features)
-  counter = collections.Counter(features)
+  for token in tokens:
+    for analysis in _analyze(token):
+      for ig in analysis.ig:
+        for inflection in ig.inflection:
+          feature = inflection.feature
+          category_value = (feature.category, feature.value)
+          counts[category_value] = counts.get(category_value, 0) + 1
+
+  total_count = sum(counts.values())
 
   print("Distribution of inflectional features in morphological analyses of"
         " the sentence '{}'\n".format(sentence))
 
-  for category_value, count in counter.items():
+  for category_value, count in counts.items():
     frequency = round(count / total_count * 100, 2)
     print("{}-{}: {}%".format(*category_value, frequency))
 
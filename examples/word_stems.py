@@ -15,27 +15,40 @@
 
 """Extracts word stems from morphological analyses."""
 
-import itertools
-from typing import Generator
+import re
+from typing import Set
 
-from turkish_morphology import analysis_pb2
 from turkish_morphology import analyze
-from turkish_morphology import decompose
 
 from absl import app
 
+# Matches the root form and part-of-speech tag at the beginning of the first
+# inflectional group of a human-readable analysis (e.g. '(araba[NN]').
+_ROOT_REGEX = re.compile(r"\((?P<root>.+?)\[[A-Z\.,:\(\)\'\-\"`\$]+?\]")
 
-def _analyze(token: str) -> Generator[analysis_pb2.Analysis, None, None]:
+
+def _lower(string: str) -> str:
+  """Properly lowercase transforms Turkish string ("İ" -> "i", "I" -> "ı")."""
+  return string.replace("İ", "i").replace("I", "ı").lower()
+
+
+def _stems(token: str) -> Set[str]:
+  """Extracts word stems from human-readable analyses of the token.
+
+  Only the root form of the first inflectional group is needed, so it is
+  matched directly on the human-readable analyses instead of decomposing them
+  into analysis protobufs.
+  """
   human_readables = analyze.surface_form(token, use_proper_feature=False)
-  yield from map(decompose.human_readable_analysis, human_readables)
+  matches = (_ROOT_REGEX.match(hr) for hr in human_readables)
+  return {_lower(m.group("root")) for m in matches if m}
 
 
 def main(unused_argv):
   sentence = "Ayşe eve geldiğinde Ali gitmişti"
   tokens = sentence.split()
 
-  analyses = itertools.chain.from_iterable(_analyze(t) for t in tokens)
-  word_stems = set(a.ig[0].root.morpheme.lower() for a in analyses)
+  word_stems = set().union(*(_stems(t) for t in tokens))
 
   print("Unique word stems that appear in morphological analyses of the"
         " sentence '{}'\n".format(sentence))
@@ -28,12 +28,12 @@ calculating the statistics.
 
 import dataclasses
 import glob
-import itertools
 import multiprocessing
-from typing import Generator, Iterable, List, Tuple, Sequence, Set
+import re
+import sys
+from typing import Collection, List, Tuple, Sequence, Set
 
 from turkish_morphology import analyze
-from turkish_morphology import decompose
 
 from absl import app
 from absl import flags
@@ -44,7 +44,19 @@ FLAGS = flags.FLAGS
 flags.DEFINE_string("treebank_dir", "scripts/treebank",
                     "Path to the directory which contains treebank files.")
 
-_AnalysisResult = Tuple[str, List[str], List[str]]
+# Word form, followed by the number of analyses and IGs that are generated for
+# it with and without the proper feature.
+_AnalysisResult = Tuple[str, int, int, int, int]
+
+# Matches the boundary between two inflectional groups of a human-readable
+# analysis. Each derived inflectional group starts right after the closing
+# parenthesis of the previous one (e.g. '(gel[VB]+[Polarity=Pos])([VN]-DHk...'),
+# which might be followed by a proper feature when the derivation is an
+# apostrophe (e.g. '(Ali[NNP]+...)+[Proper=True]([NN]-'[Derivation=...]...').
+_IG_BOUNDARY_REGEX = re.compile(r"\)(?:\+\[Proper=(?:True|False)\])?\(\[")
+
+# Minimum number of unique word forms to analyze them in worker processes.
+_MIN_PARALLEL_WORD_FORMS = 2000
 
 
 class EvaluationError(Exception):
@@ -71,100 +83,140 @@ def _lower(string: str) -> str:
   return string.replace("İ", "i").replace("I", "ı").lower()
 
 
-def _read_tokens(treebank_dir: str) -> List[str]:
-  """Reads tokens from CoNLL data and returns them in a list."""
+def _read_word_forms(treebank_dir: str) -> Tuple[int, Set[str]]:
+  """Reads tokens from CoNLL data, returns their count and unique word forms."""
 
-  def _extract_tokens_from(line: str) -> Generator[str, None, None]:
-    """Extracts token from a CoNLL data file line."""
-    if line.isspace():  # Empty lines are sentence seperators.
-      return
+  def _read_tokens_from(path: str) -> List[str]:
+    """Reads tokens from CoNLL data file that lives in the path."""
+    logging.info(f"Reading tokens from '{path}'")
+    tokens = []
 
-    column = line.split()
+    with open(path, "r", encoding="utf-8") as reader:
+      for line in reader:
+        # Word form is on the second column, so the rest of the columns are
+        # left unsplit.
+        column = line.split(maxsplit=2)
 
-    if not len(column) >= 2:
-      raise EvaluationError(
-          f"Illformed line in source CoNLL data, only {len(column)}"
-          f" whitespace separated columns found but word form is expected"
-          f" to be on the second column.")
+        if not column:  # Empty lines are sentence seperators.
+          continue
 
-    token = column[1]
+        if not len(column) >= 2:
+          raise EvaluationError(
+              f"Illformed line in source CoNLL data, only {len(column)}"
+              f" whitespace separated columns found but word form is expected"
+              f" to be on the second column.")
 
-    if token != "_":  # It's an inflectional group, not a word form.
-      yield from token.split("_")
+        token = column[1]
 
-  def _read_tokens_from(path: str) -> Generator[str, None, None]:
-    """Reads tokens from CoNLL data file that lives in the path."""
-    logging.info(f"Reading tokens from '{path}'")
+        if token != "_":  # It's an inflectional group, not a word form.
+          tokens.extend(token.split("_"))
 
-    with open(path, "r", encoding="utf-8") as reader:
-      line_tokens = (_extract_tokens_from(line) for line in reader)
-      yield from itertools.chain.from_iterable(line_tokens)
+    return tokens
+
+  token_count = 0
+  word_forms = set()
 
-  paths = glob.iglob(f"{treebank_dir}/*.conll")
-  file_tokens = (_read_tokens_from(p) for p in paths)
-  tokens = list(itertools.chain.from_iterable(file_tokens))
+  # Tokens are case-folded file by file, so that tokens of the whole treebank
+  # are never held in memory at once.
+  for path in glob.iglob(f"{treebank_dir}/*.conll"):
+    tokens = _read_tokens_from(path)
+    token_count += len(tokens)
+    word_forms.update(_lower(t) for t in tokens)
 
-  if not tokens:
+  if not token_count:
     raise EvaluationError(
         f"No tokens found in treebank files that are under '{treebank_dir}'.")
 
-  return tokens
+  return token_count, word_forms
+
+
+def _ig_count(human_readables: Sequence[str]) -> int:
+  """Finds the total number of inflectional groups in the analysis strings."""
+  # Analyses are joined with a newline, which cannot be part of a boundary, so
+  # that all of them are scanned by a single call.
+  joined = "\n".join(human_readables)
+  boundary_count = len(_IG_BOUNDARY_REGEX.findall(joined))
+  return boundary_count + len(human_readables)
 
 
 def _gather_analyses(word_form: str) -> _AnalysisResult:
-  """Gathers generated morphological analysis strings for a word form."""
+  """Gathers generated morphological analysis and IG counts for a word form."""
+  # Analyses are counted in the worker process, so that only a handful of
+  # integers instead of all analysis strings are sent back to the main process.
   with_proper = analyze.surface_form(word_form)
   without_proper = analyze.surface_form(word_form, use_proper_feature=False)
-  return word_form, with_proper, without_proper
+  return (word_form, len(with_proper), _ig_count(with_proper),
+          len(without_proper), _ig_count(without_proper))
+
+
+def _aggregate_stats(stats: _Statistics, result: _AnalysisResult) -> None:
+  """Aggregates statistics for a word form."""
+  # Only ever called in the main process, so statistics (including the set of
+  # unparsed word forms) are plain objects that are not shared with workers.
+  (word_form, analysis_with_proper, ig_with_proper, analysis_without_proper,
+   ig_without_proper) = result
+
+  if not (analysis_with_proper and analysis_without_proper):
+    stats.failure_count += 1
+    stats.unparsed.add(word_form)
+    return
 
+  stats.success_count += 1
 
-def _evaluate(word_forms: Iterable[str]) -> _Statistics:
+  stats.with_proper.analysis_count += analysis_with_proper
+  stats.with_proper.ig_count += ig_with_proper
+
+  stats.without_proper.analysis_count += analysis_without_proper
+  stats.without_proper.ig_count += ig_without_proper
+
+
+def _evaluate(word_forms: Collection[str]) -> _Statistics:
   """Collects statistics on coverage, and generated analysis and IG counts."""
   stats = _Statistics()
-  pool = multiprocessing.Pool(multiprocessing.cpu_count() - 1)
+  process_count = max(multiprocessing.cpu_count() - 1, 1)
 
-  def _ig_count(human_readable: str) -> int:
-    """Finds the number of inflectional groups in the analysis string."""
-    analysis = decompose.human_readable_analysis(human_readable)
-    return len(analysis.ig)
+  # Starting worker processes does not pay off when there is a single worker
+  # or only a few word forms to analyze.
+  if process_count == 1 or len(word_forms) < _MIN_PARALLEL_WORD_FORMS:
+    logging.info(f"Analyzing {len(word_forms)} word forms in a single process")
 
-  def _aggregate_stats(result: _AnalysisResult) -> None:
-    """Aggregates statistics for a word form."""
-    word_form, with_proper, without_proper = result
+    for result in map(_gather_analyses, word_forms):
+      _aggregate_stats(stats, result)
 
-    if not (with_proper and without_proper):
-      stats.failure_count += 1
-      stats.unparsed.add(word_form)
-      return
+    return stats
 
-    stats.success_count += 1
+  # Word forms are sent to worker processes in chunks, so that each round trip
+  # between processes carries many word forms instead of a single one.
+  chunksize = max(len(word_forms) // (process_count * 16), 1)
 
-    stats.with_proper.analysis_count += len(with_proper)
-    stats.with_proper.ig_count += sum(_ig_count(a) for a in with_proper)
+  # Forked workers inherit the analyzer FST that is loaded on import of the
+  # analyze module, whereas spawned workers would each read it from disk again.
+  # Forking after native libraries are loaded is only safe on Linux, other
+  # platforms use their default start method.
+  if sys.platform == "linux":
+    context = multiprocessing.get_context("fork")
+  else:
+    context = multiprocessing.get_context()
 
-    stats.without_proper.analysis_count += len(without_proper)
-    stats.without_proper.ig_count += sum(_ig_count(a) for a in without_proper)
+  with context.Pool(process_count) as pool:
+    results = pool.imap_unordered(_gather_analyses, word_forms, chunksize)
 
-  for word_form in word_forms:
-    pool.apply_async(_gather_analyses, (word_form,), callback=_aggregate_stats)
+    for result in results:
+      _aggregate_stats(stats, result)
 
-  pool.close()
-  pool.join()
   return stats
 
 
-def _prepare_summary(tokens: Sequence[str], word_forms: Sequence[str],
+def _prepare_summary(token_count: int, form_count: int,
                      statistics: _Statistics) -> str:
   """Generates a human-readable evaluation summary."""
-  if not tokens:
+  if not token_count:
     raise EvaluationError("Cannot generate evaluation summary without tokens.")
 
-  if not word_forms:
+  if not form_count:
     raise EvaluationError(
         "Cannot generate evaluation summary without word forms.")
 
-  token_count = len(tokens)
-  form_count = len(word_forms)
   coverage = statistics.success_count / form_count * 100
   success = statistics.success_count
   failure = statistics.failure_count
@@ -185,7 +237,7 @@ def _prepare_summary(tokens: Sequence[str], word_forms: Sequence[str],
     avg_ig_without_proper = 0
 
   if statistics.unparsed:
-    failures = "\n      ".join(u for u in sorted(statistics.unparsed))
+    failures = "\n      ".join(sorted(statistics.unparsed))
   else:
     failures = "N\\A"
 
@@ -221,10 +273,9 @@ def _prepare_summary(tokens: Sequence[str], word_forms: Sequence[str],
 
 
 def main(unused_argv):
-  tokens = _read_tokens(FLAGS.treebank_dir)
-  word_forms = set(_lower(t) for t in tokens)
+  token_count, word_forms = _read_word_forms(FLAGS.treebank_dir)
   statistics = _evaluate(word_forms)
-  summary = _prepare_summary(tokens, word_forms, statistics)
+  summary = _prepare_summary(token_count, len(word_forms), statistics)
   print(summary)
 
 
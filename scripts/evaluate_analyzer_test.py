@@ -0,0 +1,97 @@
+# coding=utf-8
+# Copyright 2020 The Google Research Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for scripts.evaluate_analyzer."""
+
+from scripts import evaluate_analyzer
+
+from absl.testing import absltest
+from absl.testing import parameterized
+
+
+class IgCountTest(parameterized.TestCase):
+
+  @parameterized.named_parameters([
+      {
+          "testcase_name": "NoAnalyses",
+          "human_readables": [],
+          "expected": 0,
+      },
+      {
+          "testcase_name":
+              "SingleInflectionalGroup",
+          "human_readables": [
+              ("(ev[NN]+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Nom])"
+               "+[Proper=False]"),
+          ],
+          "expected":
+              1,
+      },
+      {
+          "testcase_name":
+              "DerivedInflectionalGroup",
+          "human_readables": [
+              ("(gel[VB]+[Polarity=Pos])([VN]-DHk[Derivation=PastNom]"
+               "+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Nom])"
+               "+[Proper=False]"),
+          ],
+          "expected":
+              2,
+      },
+      {
+          "testcase_name":
+              "ApostropheDerivationWithProperFeature",
+          "human_readables": [
+              ("(Ali[NNP]+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Nom])"
+               "+[Proper=True]([NN]-'[Derivation=Apostrophe]"
+               "+[PersonNumber=A3sg]+[Possessive=Pnon]+DA[Case=Loc])"
+               "+[Proper=True]"),
+          ],
+          "expected":
+              2,
+      },
+      {
+          "testcase_name":
+              "ApostropheDerivationWithoutProperFeature",
+          "human_readables": [
+              ("(Ali[NNP]+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Nom])"
+               "([NN]-'[Derivation=Apostrophe]+[PersonNumber=A3sg]"
+               "+[Possessive=Pnon]+DA[Case=Loc])"),
+          ],
+          "expected":
+              2,
+      },
+      {
+          "testcase_name":
+              "MultipleAnalyses",
+          "human_readables": [
+              ("(ev[NN]+[PersonNumber=A3sg]+[Possessive=Pnon]+DA[Case=Loc])"
+               "([JJ]-ki[Derivation=Rel])+[Proper=False]"),
+              ("(ev[NN]+[PersonNumber=A3sg]+[Possessive=Pnon]+DA[Case=Loc])"
+               "([JJ]-ki[Derivation=Rel])+[Proper=True]"),
+              ("(Ali[NNP]+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Nom])"
+               "+[Proper=True]"),
+          ],
+          "expected":
+              5,
+      },
+  ])
+  def test_success(self, human_readables, expected):
+    actual = evaluate_analyzer._ig_count(human_readables)
+    self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+  absltest.main()
@@ -15,6 +15,7 @@
 
 """Functions to parse lexicon entries into rewrite rule objects."""
 
+import functools
 import itertools
 from typing import Dict, Generator, Iterable, List
 
@@ -23,7 +24,6 @@ from src.analyzer.morphotactics import common
 from src.analyzer.morphotactics import rule_pb2
 
 _LexiconEntry = Dict[str, str]
-_RewriteRule = rule_pb2.RewriteRule
 _RewriteRuleSet = rule_pb2.RewriteRuleSet
 
 
@@ -40,11 +40,16 @@ def _upper(string: str) -> str:
 def _capitalize(string: str) -> str:
   """Properly capitalizes Turkish string (string initial "i" -> "İ")."""
   if string.startswith("i"):
-    string.replace("i", "İ", 1)
+    string = string.replace("i", "İ", 1)
 
   return string.replace("I", "ı").capitalize()
 
 
+def _remove_circumflex(string: str) -> str:
+  """Replaces characters with circumflex by their counterparts without it."""
+  return string.replace("â", "a").replace("î", "i").replace("û", "u")
+
+
 def _format_root(root: str, tag: str) -> str:
   """Case formats the root annotation given the tag for lexicon entry."""
   formatting = tags.FORMATTING[tag]
@@ -82,12 +87,6 @@ def _normalize(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
   Returns:
     Lexicon entries whose annotations are normalized.
   """
-  circumflex = {
-      "â": "a",
-      "î": "i",
-      "û": "u",
-  }
-
   def _normalize_entry(entry: _LexiconEntry) -> _LexiconEntry:
     entry["tag"] = entry["tag"].upper()
     entry["is_compound"] = entry["is_compound"].lower() == "true"
@@ -99,16 +98,13 @@ def _normalize(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
     return entry
 
   def _root_has_circumflex(entry: _LexiconEntry) -> bool:
-    return any(c in entry["root"] for c in circumflex.keys())
+    root = entry["root"]
+    return "â" in root or "î" in root or "û" in root
 
   def _make_entry(entry: _LexiconEntry) -> _LexiconEntry:
-    fields_to_check = ("root", "morphophonemics")
-    field_and_chars = itertools.product(fields_to_check, circumflex.items())
     normalized = entry.copy()
-
-    for field, (with_, without) in field_and_chars:
-      normalized[field] = normalized[field].replace(with_, without)
-
+    normalized["root"] = _remove_circumflex(entry["root"])
+    normalized["morphophonemics"] = _remove_circumflex(entry["morphophonemics"])
     return normalized
 
   normalized = [_normalize_entry(e) for e in entries]
@@ -117,6 +113,44 @@ def _normalize(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
   return normalized
 
 
+def _keeps_features(old_tag: str, new_tag: str) -> bool:
+  """Checks if features carry over when cross-classifying between the tags."""
+  return _tags_keep_features(old_tag, new_tag, tags.tables_version())
+
+
+@functools.lru_cache(maxsize=None)
+def _tags_keep_features(old_tag: str, new_tag: str, version: int) -> bool:
+  """Checks if features carry over when cross-classifying between the tags.
+
+  Args:
+    old_tag: part-of-speech tag of the source lexicon entry.
+    new_tag: part-of-speech tag that the lexicon entry is cross-classified as.
+    version: version of the tag dictionaries. It is only used as part of the
+      cache key, so that the result is recomputed when the tag dictionaries are
+      updated.
+
+  Returns:
+    True, if required (or optional) features that are defined for the source
+    part-of-speech in REQUIRED_FEATURES (or OPTIONAL_FEATURES) dictionary of
+    //morphotactics_compiler/lexicon/tags.py are defined as the same for the
+    target part-of-speech. Otherwise, returns false.
+  """
+  del version  # Only used as part of the cache key.
+  old_required = tags.REQUIRED_FEATURES[old_tag]
+  new_required = tags.REQUIRED_FEATURES[new_tag]
+
+  # Required feature categories must also appear in the same order, since the
+  # validator enforces the category order of the annotation.
+  if (old_required
+      and tuple(old_required.items()) == tuple(new_required.items())):
+    return True
+
+  old_optional = tags.OPTIONAL_FEATURES[old_tag]
+  new_optional = tags.OPTIONAL_FEATURES[new_tag]
+
+  return bool(old_optional and old_optional == new_optional)
+
+
 def _cross_classify(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
   """Cross-classifies lexicon entries across parts of speech.
 
@@ -142,16 +176,7 @@ def _cross_classify(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
     if new_tag == "NOMP-CASE-BARE":
       return "+[PersonNumber=A3sg]+[Possessive=Pnon]+[Case=Bare]"
 
-    old_required = tags.REQUIRED_FEATURES[old_tag]
-    new_required = tags.REQUIRED_FEATURES[new_tag]
-
-    if (old_required and old_required == new_required):
-      return old_features
-
-    old_optional = tags.OPTIONAL_FEATURES[old_tag]
-    new_optional = tags.OPTIONAL_FEATURES[new_tag]
-
-    if (old_optional and old_optional == new_optional):
+    if _keeps_features(old_tag, new_tag):
       return old_features
 
     return ""
@@ -167,9 +192,9 @@ def _cross_classify(entries: Iterable[_LexiconEntry]) -> List[_LexiconEntry]:
   def _new_entries(
       entry: _LexiconEntry) -> Generator[_LexiconEntry, None, None]:
     old_tag = entry["tag"]
-    new_tags = tags.CROSS_CLASSIFY_AS[old_tag]
-    args = itertools.product([entry], [old_tag], new_tags)
-    yield from (_make_entry(*a) for a in args)
+
+    for new_tag in tags.CROSS_CLASSIFY_AS[old_tag]:
+      yield _make_entry(entry, old_tag, new_tag)
 
   cross_classified = list(entries)
   new_entries = itertools.chain.from_iterable(map(_new_entries, entries))
@@ -213,24 +238,6 @@ def _rule_output(entry: _LexiconEntry) -> str:
   return _lower(entry["root"])
 
 
-def _create_rewrite_rule(entry: _LexiconEntry) -> _RewriteRule:
-  """Creates a rewrite rule from the lexicon entry.
-
-  Args:
-    entry: lexicon entry which will be used to generate a rewrite rule.
-
-  Returns:
-    Rewrite rule object that defines a state transition arc of the
-    morphotactics FST.
-  """
-  rule = _RewriteRule()
-  rule.from_state = common.START_STATE
-  rule.to_state = entry["tag"]
-  rule.input = _rule_input(entry)
-  rule.output = _rule_output(entry)
-  return rule
-
-
 def parse(entries: Iterable[_LexiconEntry]) -> _RewriteRuleSet:
   """Generates a rewrite rule set from lexicon entries.
 
@@ -246,7 +253,19 @@ def parse(entries: Iterable[_LexiconEntry]) -> _RewriteRuleSet:
   """
   normalized = _normalize(entries)
   cross_classified = _cross_classify(normalized)
-  state_entries = (e for e in cross_classified if e["tag"] in tags.FST_STATES)
   rule_set = _RewriteRuleSet()
-  rule_set.rule.extend(map(_create_rewrite_rule, state_entries))
+
+  # Rewrite rules are constructed in place in the rule set, instead of being
+  # constructed separately and then copied into it.
+  for entry in cross_classified:
+    if entry["tag"] not in tags.FST_STATES:
+      continue
+
+    rule_set.rule.add(
+        from_state=common.START_STATE,
+        to_state=entry["tag"],
+        input=_rule_input(entry),
+        output=_rule_output(entry),
+    )
+
   return rule_set
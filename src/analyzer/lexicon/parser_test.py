@@ -15,8 +15,6 @@
 
 """Tests for src.analyzer.lexicon.parser."""
 
-import collections
-
 from src.analyzer.lexicon import parser
 from src.analyzer.lexicon import tags
 from src.analyzer.morphotactics import rule_pb2
@@ -35,10 +33,10 @@ def setUpModule():
       tags.TagSetItem(tag="TAG-1"),
       tags.TagSetItem(
           tag="TAG-2",
-          required_features=collections.OrderedDict([
-              ("Cat1", {"Val11", "Val12"}),
-              ("Cat2", {"Val21", "Val22"}),
-          ]),
+          required_features={
+              "Cat1": {"Val11", "Val12"},
+              "Cat2": {"Val21", "Val22"},
+          },
       ),
       tags.TagSetItem(
           tag="TAG-3",
@@ -65,10 +63,10 @@ def setUpModule():
       tags.TagSetItem(
           tag="TAG-8",
           cross_classify_as=("TAG-1",),
-          required_features=collections.OrderedDict([
-              ("Cat1", {"Val11", "Val12"}),
-              ("Cat2", {"Val21", "Val22"}),
-          ]),
+          required_features={
+              "Cat1": {"Val11", "Val12"},
+              "Cat2": {"Val21", "Val22"},
+          },
       ),
       tags.TagSetItem(
           tag="TAG-9",
@@ -81,10 +79,10 @@ def setUpModule():
       tags.TagSetItem(
           tag="TAG-10",
           cross_classify_as=("TAG-2",),
-          required_features=collections.OrderedDict([
-              ("Cat1", {"Val11", "Val12"}),
-              ("Cat2", {"Val21", "Val22"}),
-          ]),
+          required_features={
+              "Cat1": {"Val11", "Val12"},
+              "Cat2": {"Val21", "Val22"},
+          },
       ),
       tags.TagSetItem(
           tag="TAG-11",
@@ -111,6 +109,7 @@ def setUpModule():
   tags.CROSS_CLASSIFY_AS.update({t.tag: t.cross_classify_as for t in tag_set})
   tags.REQUIRED_FEATURES.update({t.tag: t.required_features for t in tag_set})
   tags.OPTIONAL_FEATURES.update({t.tag: t.optional_features for t in tag_set})
+  tags.tables_updated()
 
 
 class ParseTest(parameterized.TestCase):
@@ -296,6 +295,26 @@ class ParseTest(parameterized.TestCase):
               }
               """,
       },
+      {
+          "testcase_name":
+              "NormalizesRootWithInitialDottedIToCapitalized",
+          "entries": [{
+              "tag": "tAg-6",
+              "root": "i-VaLID-RoOt",
+              "morphophonemics": "~",
+              "features": "~",
+              "is_compound": "False",
+          }],
+          "expected_pbtxt":
+              """
+              rule {
+                from_state: 'START'
+                to_state: 'TAG-6'
+                input: '(İ-valıd-root[TAG-6]'
+                output: 'i-valıd-root'
+              }
+              """,
+      },
       {
           "testcase_name":
               "NormalizesCharactersWithCircumflexWithEmptyMorphotactics",
@@ -15,18 +15,11 @@
 
 """Functions to read TSV structured lexicon files."""
 
-import collections
-import itertools
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 _LexiconEntry = Dict[str, str]
 
 
-def _whitespace_trimmed(line: str) -> str:
-  """Strips any leading and trailing whitespace off from the line."""
-  return line.lstrip().rstrip()
-
-
 def _empty(line: str) -> bool:
   """Returns True if line is empty (or only contains whitespace)."""
   return not line or line.isspace()
@@ -34,7 +27,7 @@ def _empty(line: str) -> bool:
 
 def _split(line: str) -> List[str]:
   """Returns a list of whitespace trimmed columns that compose the line."""
-  return [_whitespace_trimmed(c) for c in line.split("\t")]
+  return [c.strip() for c in line.split("\t")]
 
 
 def read_lexicon_entries(path: str) -> Dict[int, _LexiconEntry]:
@@ -53,20 +46,15 @@ def read_lexicon_entries(path: str) -> Dict[int, _LexiconEntry]:
     pruned and lexicon entries are sorted by increasing row index. Returns an
     empty dictionary, if the TSV dump does not contain any lexicon entries.
   """
-  with open(path, "r", encoding="utf-8") as reader:
-    lines = reader.readlines()
+  entries = {}
 
-  # Line 1 is assumed to be the TSV header. Any line below the header is
-  # assumed to be a lexicon entry.
-  header, entries = lines[0], lines[1:]
-
-  if not entries:
-    return collections.OrderedDict()
-
-  field_names = _split(header)
+  with open(path, "r", encoding="utf-8") as reader:
+    # Line 1 is assumed to be the TSV header. Any line below the header is
+    # assumed to be a lexicon entry.
+    field_names = _split(next(reader, ""))
 
-  def _index_and_entry(index: int, line: str) -> Tuple[int, _LexiconEntry]:
-    return index + 2, dict(zip(field_names, _split(line)))
+    for index, line in enumerate(reader, start=2):
+      if not _empty(line):
+        entries[index] = dict(zip(field_names, _split(line)))
 
-  non_empty = ((i, l) for i, l in enumerate(entries) if not _empty(l))
-  return collections.OrderedDict(itertools.starmap(_index_and_entry, non_empty))
+  return entries
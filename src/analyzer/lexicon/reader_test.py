@@ -15,7 +15,6 @@
 
 """Tests for src.analyzer.lexicon.reader."""
 
-import collections
 import os
 
 from src.analyzer.lexicon import reader
@@ -26,12 +25,6 @@ from absl.testing import parameterized
 _TESTDATA_DIR = "src/analyzer/lexicon/testdata"
 
 
-def _read_file(path):
-  with open(path, "r") as f:
-    read = f.read()
-  return read
-
-
 class ReadLexiconEntriesTest(parameterized.TestCase):
 
   @parameterized.named_parameters([
@@ -41,55 +34,55 @@ class ReadLexiconEntriesTest(parameterized.TestCase):
           "basename":
               "valid_entries_1",
           "expected":
-              collections.OrderedDict((
-                  (2, {
+              {
+                  2: {
                       "tag": "Nn",
                       "root": "ABANOZ",
                       "morphophonemics": "~",
                       "features": "~",
                       "is_compound": "FALSE",
-                  }),
-                  (3, {
+                  },
+                  3: {
                       "tag": "nN",
                       "root": "âhît",
                       "morphophonemics": "âhî?t~",
                       "features": "~",
                       "is_compound": "FaLsE",
-                  }),
-                  (4, {
+                  },
+                  4: {
                       "tag": "nn",
                       "root": "ördekbaşı",
                       "morphophonemics": "ördekbaş",
                       "features": "~",
                       "is_compound": "true",
-                  }),
-                  (6, {
+                  },
+                  6: {
                       "tag": "Jj",
                       "root": "KIZIL",
                       "morphophonemics": "~",
                       "features": "~",
                       "is_compound": "FALSE",
-                  }),
-                  (7, {
+                  },
+                  7: {
                       "tag": "jJ",
                       "root": "kopkoyu",
                       "morphophonemics": "~",
                       "features": "+[Emphasis=True]",
                       "is_compound": "false",
-                  }),
-                  (8, {
+                  },
+                  8: {
                       "tag": "in",
                       "root": "ArT",
                       "morphophonemics": "~",
                       "features": "+[ComplementType=CGen]",
                       "is_compound": "FALSE",
-                  }),
-              )),
+                  },
+              },
       },
       {
           "testcase_name": "InvalidLexiconWithOnlyHeader",
           "basename": "invalid_only_header",
-          "expected": collections.OrderedDict(),
+          "expected": {},
       },
   ])
   def test_success(self, basename, expected):
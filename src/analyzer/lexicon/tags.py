@@ -15,9 +15,8 @@
 
 """Dictionaries that are used to validate and cross-classify tags of entries."""
 
-import collections
 import dataclasses
-from typing import Dict, OrderedDict, Set, Tuple
+from typing import Dict, Set, Tuple
 
 
 @dataclasses.dataclass
@@ -27,8 +26,7 @@ class TagSetItem:
   formatting: str = dataclasses.field(default="lower")
   is_fst_state: bool = dataclasses.field(default=True)
   cross_classify_as: Tuple = dataclasses.field(default_factory=tuple)
-  required_features: OrderedDict[str, Set] = dataclasses.field(
-      default_factory=collections.OrderedDict)
+  required_features: Dict[str, Set] = dataclasses.field(default_factory=dict)
   optional_features: Dict[str, Set] = dataclasses.field(default_factory=dict)
 
 
@@ -53,10 +51,11 @@ _TAG_SET = (
     TagSetItem(
         tag="IN",
         cross_classify_as=("NN", "NOMP"),
-        required_features=collections.OrderedDict([
-            ("ComplementType",
-             {"CAbl", "CAcc", "CBare", "CDat", "CFin", "CGen", "CIns", "CNum"}),
-        ]),
+        required_features={
+            "ComplementType": {
+                "CAbl", "CAcc", "CBare", "CDat", "CFin", "CGen", "CIns", "CNum"
+            },
+        },
     ),
     # ADV: Adverb.
     TagSetItem(
@@ -70,9 +69,9 @@ _TAG_SET = (
         tag="RB-TEMP",
         output_as="RB",
         cross_classify_as=("NN-TEMP", "NOMP"),
-        required_features=collections.OrderedDict([
-            ("Temporal", {"True"}),
-        ]),
+        required_features={
+            "Temporal": {"True"},
+        },
     ),
     TagSetItem(
         tag="WRB",
@@ -83,17 +82,17 @@ _TAG_SET = (
     # CONJ: Conjunction.
     TagSetItem(
         tag="CC",
-        required_features=collections.OrderedDict([
-            ("ConjunctionType", {"Adv", "Coor", "Par", "Sub"}),
-        ]),
+        required_features={
+            "ConjunctionType": {"Adv", "Coor", "Par", "Sub"},
+        },
     ),
     # DET: Determiner.
     TagSetItem(
         tag="DT",
         cross_classify_as=("NOMP", "PRI"),
-        required_features=collections.OrderedDict([
-            ("DeterminerType", {"Def", "Dem", "Dir", "Ind"}),
-        ]),
+        required_features={
+            "DeterminerType": {"Def", "Dem", "Dir", "Ind"},
+        },
     ),
     TagSetItem(
         tag="PDT",
@@ -132,9 +131,9 @@ _TAG_SET = (
     TagSetItem(
         tag="NN-TEMP",
         output_as="NN",
-        required_features=collections.OrderedDict([
-            ("Temporal", {"True"}),
-        ]),
+        required_features={
+            "Temporal": {"True"},
+        },
     ),
     TagSetItem(
         tag="NNP",
@@ -173,18 +172,18 @@ _TAG_SET = (
         tag="PRD-PNON",
         output_as="PRD",
         cross_classify_as=("NOMP-PNON",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+        },
     ),
     TagSetItem(
         tag="PRD-PNPOSS",
         output_as="PRD",
         cross_classify_as=("NOMP-PNPOSS",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+        },
     ),
     TagSetItem(
         tag="PRI",
@@ -193,36 +192,36 @@ _TAG_SET = (
     TagSetItem(
         tag="PRP",
         cross_classify_as=("NOMP-PN",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+        },
     ),
     TagSetItem(
         tag="PRP-CASE",
         output_as="PRP",
         cross_classify_as=("NOMP-CASE-MARKED",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-            ("Case", {"Acc", "Abl", "Dat", "Gen", "Ins", "Loc"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+            "Case": {"Acc", "Abl", "Dat", "Gen", "Ins", "Loc"},
+        },
     ),
     TagSetItem(
         tag="PRP-IRR",
         output_as="PRP",
         cross_classify_as=("NOMP-PNON",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+        },
     ),
     TagSetItem(
         tag="PRP$",
         cross_classify_as=("NOMP-PNON",),
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+        },
     ),
     TagSetItem(
         tag="PRR",
@@ -286,42 +285,42 @@ _TAG_SET = (
     TagSetItem(
         tag="NOMP-CASE-BARE",
         output_as="NOMP",
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A3sg"}),
-            ("Possessive", {"Pnon"}),
-            ("Case", {"Bare"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A3sg"},
+            "Possessive": {"Pnon"},
+            "Case": {"Bare"},
+        },
     ),
     TagSetItem(
         tag="NOMP-CASE-MARKED",
         output_as="NOMP",
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-            ("Case", {"Acc", "Abl", "Dat", "Gen", "Ins", "Loc"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+            "Case": {"Acc", "Abl", "Dat", "Gen", "Ins", "Loc"},
+        },
     ),
     TagSetItem(
         tag="NOMP-PN",
         output_as="NOMP",
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+        },
     ),
     TagSetItem(
         tag="NOMP-PNON",
         output_as="NOMP",
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-            ("Possessive", {"Pnon"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+            "Possessive": {"Pnon"},
+        },
     ),
     TagSetItem(
         tag="NOMP-PNPOSS",
         output_as="NOMP",
-        required_features=collections.OrderedDict([
-            ("PersonNumber", {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"}),
-        ]),
+        required_features={
+            "PersonNumber": {"A1sg", "A2sg", "A3sg", "A1pl", "A2pl", "A3pl"},
+        },
     ),
     TagSetItem(
         tag="NOMP-WITH-APOS",
@@ -435,3 +434,20 @@ REQUIRED_FEATURES = {t.tag: t.required_features for t in _TAG_SET}
 # be annotated with one of the feature category-value pairs in the
 # corresponding dicionary of optional features.
 OPTIONAL_FEATURES = {t.tag: t.optional_features for t in _TAG_SET}
+
+# Version of the dictionaries above. Values that are derived from them are
+# cached by other modules (e.g. compiled feature schemas in validator.py) using
+# this version as part of the cache key, so whenever the dictionaries are
+# updated at runtime, tables_updated() should be called to invalidate them.
+_tables_version = 0
+
+
+def tables_version() -> int:
+  """Returns the current version of the tag dictionaries."""
+  return _tables_version
+
+
+def tables_updated() -> None:
+  """Invalidates cached values that are derived from the tag dictionaries."""
+  global _tables_version
+  _tables_version += 1
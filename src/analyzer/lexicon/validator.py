@@ -15,8 +15,10 @@
 
 """Functions to validate lexicon entries."""
 
+import dataclasses
+import functools
 import re
-from typing import Dict, Generator, Tuple
+from typing import Dict, FrozenSet, Tuple
 
 from src.analyzer.lexicon import tags
 
@@ -32,12 +34,59 @@ _REQUIRED_FIELDS = set([
     "features",
     "is_compound",
 ])
+_VALID_COMPOUND_VALUES = set([
+    "true",
+    "false",
+])
 
 
 class InvalidLexiconEntryError(Exception):
   """Raised when a lexicon entry is illformed."""
 
 
+@dataclasses.dataclass(frozen=True)
+class _FeatureSchema:
+  required_categories: Tuple[str, ...]
+  required_values: Tuple[FrozenSet[str], ...]
+  optional_pairs: FrozenSet[_FeatureCategoryValuePair]
+
+
+def _feature_schema(tag: str) -> _FeatureSchema:
+  """Returns the feature schema of the tag for the current tag dictionaries."""
+  return _compile_feature_schema(tag, tags.tables_version())
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_feature_schema(tag: str, version: int) -> _FeatureSchema:
+  """Compiles required and optional features of the tag into a schema.
+
+  Required feature categories are kept in the order they are expected to appear
+  in the features annotation, and their valid values are stored as frozensets
+  that are aligned with the categories. Optional features are flattened into a
+  frozenset of valid category-value pairs, so that validating an entry only
+  requires a set lookup per annotated feature.
+
+  Args:
+    tag: normalized tag annotation of a lexicon entry.
+    version: version of the tag dictionaries the schema is compiled from. It is
+      only used as part of the cache key, so that schemas are recompiled when
+      the tag dictionaries are updated.
+
+  Returns:
+    Feature schema which is compiled from the REQUIRED_FEATURES and
+    OPTIONAL_FEATURES dictionaries of //src/analyzer/lexicon/tags.py.
+  """
+  del version  # Only used as part of the cache key.
+  required = tags.REQUIRED_FEATURES[tag]
+  optional = tags.OPTIONAL_FEATURES[tag]
+  return _FeatureSchema(
+      required_categories=tuple(required.keys()),
+      required_values=tuple(frozenset(v) for v in required.values()),
+      optional_pairs=frozenset(
+          (c, v) for c, values in optional.items() for v in values),
+  )
+
+
 def _tag_of(entry: _LexiconEntry) -> str:
   """Returns normalized tag annotation of the entry."""
   return entry["tag"].upper()
@@ -58,10 +107,25 @@ def _is_compound_of(entry: _LexiconEntry) -> str:
   return entry["is_compound"].lower()
 
 
+@functools.lru_cache(maxsize=None)
 def _category_value_pairs(
-    features: str) -> Generator[_FeatureCategoryValuePair, None, None]:
-  """Extracts feature category-value pairs from features annotation string."""
-  yield from (f for f in _FEATURE_CATEGORY_VALUE_REGEX.findall(features) if f)
+    features: str) -> Tuple[_FeatureCategoryValuePair, ...]:
+  """Extracts feature category-value pairs from features annotation string.
+
+  Features annotation is scanned only once for each distinct annotation string,
+  both to check its well-formedness and to extract its category-value pairs.
+
+  Args:
+    features: features annotation of a lexicon entry (e.g. '+[Cat1=Val1]').
+
+  Returns:
+    Feature category-value pairs in the order they appear in the annotation.
+    Returns an empty tuple if the features annotation is illformed.
+  """
+  if not _FEATURES_REGEX.fullmatch(features):
+    return ()
+
+  return tuple(_FEATURE_CATEGORY_VALUE_REGEX.findall(features))
 
 
 def _entry_has_required_fields(entry: _LexiconEntry) -> None:
@@ -112,9 +176,8 @@ def _entry_tag_is_valid(entry: _LexiconEntry) -> None:
 def _entry_compound_annotation_is_valid(entry: _LexiconEntry) -> None:
   """Checks if entry compound annotation is valid ('true' or 'false')."""
   compound = _is_compound_of(entry)
-  valid_values = ("true", "false")
 
-  if compound not in valid_values:
+  if compound not in _VALID_COMPOUND_VALUES:
     raise InvalidLexiconEntryError(
         "Entry 'is_compound' field has invalid value. It can only have the"
         " values 'true' or 'false'.")
@@ -135,7 +198,7 @@ def _entry_features_annotation_is_valid(entry: _LexiconEntry) -> None:
   """Checks if entry features annotation is valid (e.g. '+[Cat=Tag]...')."""
   features = _features_of(entry)
 
-  if not (features == "~" or _FEATURES_REGEX.fullmatch(features)):
+  if not (features == "~" or _category_value_pairs(features)):
     raise InvalidLexiconEntryError(
         "Entry features annotation is invalid. Features need to be annotated"
         " as '+[Category_1=Value_x]...+[Category_n=Value_y].")
@@ -144,56 +207,52 @@ def _entry_features_annotation_is_valid(entry: _LexiconEntry) -> None:
 def _entry_has_required_features(entry: _LexiconEntry) -> None:
   """Checks if entry has features if its expected to have required features."""
   features = _features_of(entry)
-  tag = _tag_of(entry)
-  required = tags.REQUIRED_FEATURES[tag]
+  schema = _feature_schema(_tag_of(entry))
 
-  if features == "~" and required:
+  if features == "~" and schema.required_categories:
     raise InvalidLexiconEntryError("Entry is missing required features.")
 
 
 def _entry_required_features_are_valid(entry: _LexiconEntry) -> None:
   """Checks if entry has the expected set of required features."""
-  tag = _tag_of(entry)
-  required = tags.REQUIRED_FEATURES[tag]
+  schema = _feature_schema(_tag_of(entry))
 
-  if not required:
+  if not schema.required_categories:
     return
 
   features = _features_of(entry)
   category_value = _category_value_pairs(features)
   categories, values = zip(*category_value)
 
-  if categories != tuple(required.keys()):
+  if categories != schema.required_categories:
     raise InvalidLexiconEntryError(
         "Entry has invalid required feature category.")
 
-  if any(v not in r for v, r in zip(values, required.values())):
+  if any(v not in r for v, r in zip(values, schema.required_values)):
     raise InvalidLexiconEntryError("Entry has invalid required feature value.")
 
 
 def _entry_optional_features_are_valid(entry: _LexiconEntry) -> None:
   """Checks if optional features of the entry are valid."""
-  tag = _tag_of(entry)
-  optional = tags.OPTIONAL_FEATURES[tag]
+  schema = _feature_schema(_tag_of(entry))
 
-  if not optional:
+  if not schema.optional_pairs:
     return
 
   features = _features_of(entry)
   category_value = _category_value_pairs(features)
 
-  if not all(c in optional and v in optional[c] for c, v in category_value):
+  if not schema.optional_pairs.issuperset(category_value):
     raise InvalidLexiconEntryError("Entry has invalid optional features.")
 
 
 def _entry_features_are_not_redundant(entry: _LexiconEntry) -> None:
   """Checks if entry doesn't have features if its not expected to have any."""
   features = _features_of(entry)
-  tag = _tag_of(entry)
-  required = tags.REQUIRED_FEATURES[tag]
-  optional = tags.OPTIONAL_FEATURES[tag]
+  schema = _feature_schema(_tag_of(entry))
+  expected = schema.required_categories or schema.optional_pairs
 
-  if not (required or optional) and features != "~":
+  if not expected and features != "~":
     raise InvalidLexiconEntryError(
         "Entry has features while it is not expected to have any.")
 
@@ -15,8 +15,6 @@
 
 """Tests for src.analyzer.lexicon.validator."""
 
-import collections
-
 from src.analyzer.lexicon import tags
 from src.analyzer.lexicon import validator
 
@@ -33,10 +31,10 @@ def setUpModule():
       tags.TagSetItem(tag="TAG-1"),
       tags.TagSetItem(
           tag="TAG-2",
-          required_features=collections.OrderedDict([
-              ("Cat1", {"Val11", "Val12"}),
-              ("Cat2", {"Val21", "Val22"}),
-          ]),
+          required_features={
+              "Cat1": {"Val11", "Val12"},
+              "Cat2": {"Val21", "Val22"},
+          },
       ),
       tags.TagSetItem(
           tag="TAG-3",
@@ -49,6 +47,7 @@ def setUpModule():
   tags.VALID_TAGS.update({t.tag for t in tag_set})
   tags.REQUIRED_FEATURES.update({t.tag: t.required_features for t in tag_set})
   tags.OPTIONAL_FEATURES.update({t.tag: t.optional_features for t in tag_set})
+  tags.tables_updated()
 
 
 class ValidateTest(parameterized.TestCase):
@@ -512,6 +511,31 @@ class ValidateTest(parameterized.TestCase):
     with self.assertRaisesRegexp(validator.InvalidLexiconEntryError, message):
       validator.validate(entry)
 
+  def test_uses_updated_tag_tables(self):
+    tags.VALID_TAGS.add("TAG-4")
+    tags.REQUIRED_FEATURES["TAG-4"] = {}
+    tags.OPTIONAL_FEATURES["TAG-4"] = {"Cat1": {"Val11"}}
+    tags.tables_updated()
+    self.addCleanup(tags.tables_updated)
+    self.addCleanup(tags.OPTIONAL_FEATURES.pop, "TAG-4")
+    self.addCleanup(tags.REQUIRED_FEATURES.pop, "TAG-4")
+    self.addCleanup(tags.VALID_TAGS.discard, "TAG-4")
+    entry = {
+        "tag": "TaG-4",
+        "root": "valid-root",
+        "morphophonemics": "valid-morphophonemics",
+        "features": "+[Cat1=Val11]",
+        "is_compound": "TrUe",
+    }
+    validator.validate(entry)
+
+    tags.OPTIONAL_FEATURES["TAG-4"] = {"Cat1": {"Val12"}}
+    tags.tables_updated()
+
+    with self.assertRaisesRegexp(validator.InvalidLexiconEntryError,
+                                 "Entry has invalid optional features."):
+      validator.validate(entry)
+
 
 if __name__ == "__main__":
   absltest.main()
@@ -136,7 +136,11 @@ def _get_lexicon_rules(lexicon_dir: str) -> _RewriteRuleSet:
   paths = sorted(glob.glob(f"{lexicon_dir}/*.tsv"))
   rule_sets = [_read_rule_set(p) for p in paths]
   lexicon = _RewriteRuleSet()
-  lexicon.rule.extend(r for rs in rule_sets for r in rs.rule)
+
+  # Merging whole rule sets appends their rules in a single call, instead of
+  # copying rewrite rule objects into the repeated field one at a time.
+  for rule_set in rule_sets:
+    lexicon.MergeFrom(rule_set)
 
   if not lexicon.rule:
     raise MorphotacticsCompilerError("no valid lexicon rewrite rules found.")
@@ -174,12 +178,14 @@ def _get_morphotactics_rules(morphotactics_dir: str) -> _RewriteRuleSet:
         raise MorphotacticsCompilerError(
             f"Rewrite rule at line {index} of '{path}' is illformed. {error}")
 
-    return morphotactics_parser.parse(list(lines.values()))
+    return morphotactics_parser.parse(lines.values())
 
   paths = sorted(glob.glob(f"{morphotactics_dir}/*.txt"))
   rule_sets = [_read_rule_set(p) for p in paths]
   morphotactics = _RewriteRuleSet()
-  morphotactics.rule.extend(r for rs in rule_sets for r in rs.rule)
+
+  for rule_set in rule_sets:
+    morphotactics.MergeFrom(rule_set)
 
   if not morphotactics.rule:
     raise MorphotacticsCompilerError(
@@ -409,8 +415,8 @@ def main(unused_argv):
   morphotactics = _get_morphotactics_rules(FLAGS.morphotactics_dir)
 
   merged = _RewriteRuleSet()
-  merged.rule.extend(lexicon.rule)
-  merged.rule.extend(morphotactics.rule)
+  merged.MergeFrom(lexicon)
+  merged.MergeFrom(morphotactics)
   _remove_duplicate_rules(merged)
 
   symbols_content = _symbols_table_file_content(merged)
@@ -15,70 +15,23 @@
 
 """Functions to parse rule definitions into rewrite rule objects."""
 
-from typing import Generator, Iterable, List
+from typing import Iterable, List
 
 from src.analyzer.morphotactics import rule_pb2
 
-_RewriteRule = rule_pb2.RewriteRule
 _RewriteRuleSet = rule_pb2.RewriteRuleSet
 _RuleDefinition = List[str]
 
 
-def _normalize(
-    rule_definitions: Iterable[_RuleDefinition]
-) -> Generator[_RuleDefinition, None, None]:
-  """Normalizes the tokens of morphotactics rewrite rule definition.
-
-  This function converts the 'from_state' and 'to_state' values to uppercase,
-  and all bracketed 'output' and 'input' labels to lowercase (e.g. the rewrite
-  rule 'state-1 StAtE-2 +MetaMorpheme[Cat=Val] <EPS>' is normalized to
-  'STATE-1 STATE-2 +MetaMorpheme[Cat=Val] <eps>'). Normalization is done
-  in-place.
-
-  Args:
-    rule_definitions: morphotactics rule definitions whose tokens will be
-        normalized.
-
-  Yields:
-    Morphotactics rewrite rule definitions whose tokens are normalized.
-  """
-
-  def _bracketed(token: str) -> bool:
-    return token.startswith("<") and token.endswith(">")
-
-  def _get_normalized(rule_definition: _RuleDefinition) -> _RuleDefinition:
-    from_state, to_state, input_, output = rule_definition
-    rule_definition[0] = from_state.upper()
-    rule_definition[1] = to_state.upper()
-    rule_definition[2] = input_.lower() if _bracketed(input_) else input_
-    rule_definition[3] = output.lower() if _bracketed(output) else output
-    return rule_definition
-
-  yield from (_get_normalized(rd) for rd in rule_definitions)
-
-
-def _create_rewrite_rule(rule_definition: _RuleDefinition) -> _RewriteRule:
-  """Creates a rewrite rule from the morphotactics rule definition.
-
-  Args:
-    rule_definition: morphotactics rule definition which will be used to
-        generate a rewrite rule.
-
-  Returns:
-    Rewrite rule object that defines a state transition arc of the
-    morphotactics FST.
-  """
-  rule = _RewriteRule()
-  rule.from_state = rule_definition[0]
-  rule.to_state = rule_definition[1]
-  rule.input = rule_definition[2]
-  rule.output = rule_definition[3]
-  return rule
-
-
 def parse(rule_definitions: Iterable[_RuleDefinition]) -> _RewriteRuleSet:
   """Generates a rewrite rule set from morphotactics rule definitions.
 
+  Tokens of the rule definitions are normalized in-place while the rewrite
+  rules are generated. The 'from_state' and 'to_state' values are converted to
+  uppercase, and all bracketed 'output' and 'input' labels to lowercase (e.g.
+  the rewrite rule 'state-1 StAtE-2 +MetaMorpheme[Cat=Val] <EPS>' is
+  normalized to 'STATE-1 STATE-2 +MetaMorpheme[Cat=Val] <eps>').
+
   Note that this function assumes all input rule definitions are valid, meaning
   that they should be first validated with
   //src/analyzer/morphotactics/validator.py.
@@ -91,7 +44,34 @@ def parse(rule_definitions: Iterable[_RuleDefinition]) -> _RewriteRuleSet:
     Array of rewrite rule objects that defines a subset of the state transition
     arcs of the morphotactics FST.
   """
-  normalized = _normalize(rule_definitions)
   rule_set = _RewriteRuleSet()
-  rule_set.rule.extend(_create_rewrite_rule(d) for d in normalized)
+
+  for rule_definition in rule_definitions:
+    from_state, to_state, input_, output = rule_definition
+
+    # Tokens that are already normalized are left as is, since case conversion
+    # always allocates a new string.
+    if not from_state.isupper():
+      from_state = from_state.upper()
+      rule_definition[0] = from_state
+
+    if not to_state.isupper():
+      to_state = to_state.upper()
+      rule_definition[1] = to_state
+
+    if input_[:1] == "<" and input_[-1:] == ">" and not input_.islower():
+      input_ = input_.lower()
+      rule_definition[2] = input_
+
+    if output[:1] == "<" and output[-1:] == ">" and not output.islower():
+      output = output.lower()
+      rule_definition[3] = output
+
+    rule_set.rule.add(
+        from_state=from_state,
+        to_state=to_state,
+        input=input_,
+        output=output,
+    )
+
   return rule_set
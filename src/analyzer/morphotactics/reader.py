@@ -15,33 +15,11 @@
 
 """Functions to read text morphotactic model files."""
 
-import collections
-import itertools
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 _RuleDefinition = List[str]
 
 
-def _whitespace_trimmed(line: str) -> str:
-  """Strips any leading and trailing whitespace off from the line."""
-  return line.lstrip().rstrip()
-
-
-def _empty(line: str) -> bool:
-  """Returns True if line is empty (or only contains whitespace)."""
-  return not line or line.isspace()
-
-
-def _comment(line: str) -> bool:
-  """Returns True if line is a comment line (starts with '#')."""
-  return line.startswith("#")
-
-
-def _rule(line: str) -> bool:
-  """Returns True if the line defines an FST rule."""
-  return not (_empty(line) or _comment(line))
-
-
 def read_rule_definitions(path: str) -> Dict[int, _RuleDefinition]:
   """Reads morphotactics FST rule definitions from the path.
 
@@ -60,11 +38,16 @@ def read_rule_definitions(path: str) -> Dict[int, _RuleDefinition]:
     are sorted by increasing line index. Returns an empty dictionary, if
     the text file does not contain any rule definitions.
   """
+  rules = {}
+
   with open(path, "r", encoding="utf-8") as reader:
-    lines = reader.readlines()
+    for index, line in enumerate(reader, start=1):
+      # Skip empty (or whitespace only) lines and comment lines. Comments are
+      # detected on the untrimmed line, so an indented '#' yields a rule
+      # definition that is rejected by the validator.
+      if line.isspace() or line.startswith("#"):
+        continue
 
-  def _index_and_entry(index: int, line: str) -> Tuple[int, _RuleDefinition]:
-    return index + 1, _whitespace_trimmed(line).split()
+      rules[index] = line.split()
 
-  rules = ((i, l) for i, l in enumerate(lines) if _rule(l))
-  return collections.OrderedDict(itertools.starmap(_index_and_entry, rules))
+  return rules
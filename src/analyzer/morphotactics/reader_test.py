@@ -26,12 +26,6 @@ from absl.testing import parameterized
 _TESTDATA_DIR = "src/analyzer/morphotactics/testdata"
 
 
-def _read_file(path):
-  with open(path, "r") as f:
-    read = f.read()
-  return read
-
-
 class ReadRuleDefinitionsTest(parameterized.TestCase):
 
   def test_success(self):
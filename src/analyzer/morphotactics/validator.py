@@ -46,6 +46,13 @@ class InvalidMorphotacticsRuleError(Exception):
   """Raised when a morphotactics rewrite rule definition is illformed."""
 
 
+def _epsilon(label: str) -> bool:
+  """Returns True if the label is an epsilon symbol (case-insensitive)."""
+  # Bracket check short-circuits lowercasing the label, which is not needed
+  # for the vast majority of labels that are not bracketed.
+  return label[:1] == "<" and label.lower() == common.EPSILON
+
+
 def _rule_has_expected_number_of_tokens(
     rule_definition: _RuleDefinition) -> None:
   """Checks if rule definition has 4 tokens (from, to, output, input)."""
@@ -79,7 +86,7 @@ def _rule_input_is_valid(input_label: str) -> None:
     InvalidMorphotacticsRuleError: input label of the morphotactics rule
         definition does not have a valid structure.
   """
-  if input_label.lower() == common.EPSILON:
+  if _epsilon(input_label):
     return
 
   if not _RULE_INPUT_REGEX.fullmatch(input_label):
@@ -102,7 +109,7 @@ def _rule_output_is_valid(output_label: str) -> None:
     InvalidMorphotacticsRuleError: output label of the morphotactics rule
         definition does not have a valid structure.
   """
-  if output_label.lower() == common.EPSILON:
+  if _epsilon(output_label):
     return
 
   if not _RULE_OUTPUT_REGEX.fullmatch(output_label):
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: turkish_morphology/analysis.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'turkish_morphology/analysis.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n!turkish_morphology/analysis.proto\x12\x12turkish_morphology\"\x18\n\x04Root\x12\x10\n\x08morpheme\x18\x01 \x01(\t\"*\n\x07\x46\x65\x61ture\x12\x10\n\x08\x63\x61tegory\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"L\n\x05\x41\x66\x66ix\x12,\n\x07\x66\x65\x61ture\x18\x01 \x01(\x0b\x32\x1b.turkish_morphology.Feature\x12\x15\n\rmeta_morpheme\x18\x02 \x01(\t\"\xb6\x01\n\x11InflectionalGroup\x12\x0b\n\x03pos\x18\x01 \x01(\t\x12&\n\x04root\x18\x02 \x01(\x0b\x32\x18.turkish_morphology.Root\x12-\n\nderivation\x18\x03 \x01(\x0b\x32\x19.turkish_morphology.Affix\x12-\n\ninflection\x18\x04 \x03(\x0b\x32\x19.turkish_morphology.Affix\x12\x0e\n\x06proper\x18\x05 \x01(\x08\"=\n\x08\x41nalysis\x12\x31\n\x02ig\x18\x01 \x03(\x0b\x32%.turkish_morphology.InflectionalGroup')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'turkish_morphology.analysis_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_ROOT']._serialized_start=57
+  _globals['_ROOT']._serialized_end=81
+  _globals['_FEATURE']._serialized_start=83
+  _globals['_FEATURE']._serialized_end=125
+  _globals['_AFFIX']._serialized_start=127
+  _globals['_AFFIX']._serialized_end=203
+  _globals['_INFLECTIONALGROUP']._serialized_start=206
+  _globals['_INFLECTIONALGROUP']._serialized_end=388
+  _globals['_ANALYSIS']._serialized_start=390
+  _globals['_ANALYSIS']._serialized_end=451
+# @@protoc_insertion_point(module_scope)
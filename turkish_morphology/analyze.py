@@ -15,7 +15,8 @@
 
 """Functions to morphologically analyze surface forms of Turkish words."""
 
-from typing import List, Optional
+import functools
+from typing import List, Optional, Tuple
 
 from turkish_morphology import fst
 
@@ -27,6 +28,39 @@ def _remove_proper_feature(human_readable: str) -> str:
   return human_readable
 
 
+@functools.lru_cache(maxsize=2**16)
+def _human_readable_analyses(surface_form: str) -> Tuple[str, ...]:
+  """Extracts human-readable analyses of the surface form from analyzer FST.
+
+  Analyses are cached by surface form, so that repeated tokens (and queries for
+  the same surface form with and without the proper feature) compose the input
+  with the analyzer FST only once.
+
+  Args:
+    surface_form: surface form of a Turkish word that is to be morphologically
+      analyzed.
+
+  Returns:
+    Human-readable morphological analyses that include the 'Proper' feature.
+    Returns an empty tuple if the given surface form is not accepted as a
+    Turkish word form.
+  """
+  symbol_table = fst.ANALYZER.input_symbols()
+  input_ = fst.compile(surface_form.encode("utf-8"), symbol_table)
+  output = fst.compose(input_, fst.ANALYZER)
+
+  if output.start() == -1:  # has no path to the accept state.
+    return ()
+
+  return tuple(
+      fst.extract_parses(
+          output,
+          output.start(),
+          "olabel",
+          symbol_table,
+      ))
+
+
 def surface_form(surface_form: str,
                  use_proper_feature: Optional[bool] = True) -> List[str]:
   """Morphologically analyses given surface form.
@@ -42,19 +76,7 @@ def surface_form(surface_form: str,
     analyzer yields for the given surface form. Returns an empty list if the
     given surface form is not accepted as a Turkish word form.
   """
-  symbol_table = fst.ANALYZER.input_symbols()
-  input_ = fst.compile(surface_form.encode("utf-8"), symbol_table)
-  output = fst.compose(input_, fst.ANALYZER)
-
-  if output.start() == -1:  # has no path to the accept state.
-    return []
-
-  human_readable = fst.extract_parses(
-      output,
-      output.start(),
-      "olabel",
-      symbol_table,
-  )
+  human_readable = _human_readable_analyses(surface_form)
 
   if not use_proper_feature:
     human_readable = (_remove_proper_feature(hr) for hr in human_readable)